@@ -1,89 +1,654 @@
 import sys
 import json
+import numpy as np
 import pandas as pd
 import re
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+try:
+    import numba
+except ImportError:
+    numba = None
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QPushButton, QVBoxLayout, 
                              QHBoxLayout, QWidget, QFileDialog, QLabel, QTableWidget, 
                              QTableWidgetItem, QCheckBox, QMessageBox, QHeaderView, QFrame)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QColor, QFont
 
+# 이 크기 이상의 CSV는 메모리에 올리지 않고 분석 시 청크 단위로 스트리밍
+STREAM_MIN_BYTES = 512 * 1024 * 1024
+CHUNK_ROWS = 1_000_000
+
+def read_table(path, usecols=None):
+    # CSV는 pyarrow 멀티스레드 파서, xlsx는 calamine을 우선 사용하고 없으면 기본 엔진으로 대체
+    if path.endswith('.csv'):
+        try:
+            df = pd.read_csv(path, engine="pyarrow", usecols=usecols)
+        except ImportError:
+            return pd.read_csv(path, usecols=usecols)
+        # pyarrow는 날짜/시각 문자열을 date·timestamp로 추론해 스트리밍(C 엔진)과 점수가 달라지므로, 그런 컬럼이 있으면 C 엔진으로 다시 읽음
+        if any(s.dtype.kind in "mM" or (s.dtype == object and pd.api.types.infer_dtype(s, skipna=True) in ("date", "time", "datetime")) for _, s in df.items()):
+            return pd.read_csv(path, usecols=usecols)
+        return df
+    try:
+        return pd.read_excel(path, engine="calamine", usecols=usecols)
+    except (ImportError, ValueError):
+        return pd.read_excel(path, usecols=usecols)
+
+def read_csv_chunks(path, chunksize=CHUNK_ROWS, usecols=None):
+    # pyarrow 엔진은 chunksize를 지원하지 않으므로 C 엔진으로 읽는다
+    return pd.read_csv(path, chunksize=chunksize, usecols=usecols)
+
+# JIT 컴파일 비용이 있으므로 Numba 커널은 큰 배열에만 사용
+NUMBA_MIN_SIZE = 1_000_000
+# numexpr도 스레드 기동 비용이 있어 중간 크기 이상에서만 사용
+NUMEXPR_MIN_SIZE = 100_000
+
+if numba is not None:
+    # 호출 측(_counts의 스레드 풀)이 이미 컬럼 단위로 병렬화하므로 커널은 직렬로 두고 GIL만 해제
+    # (parallel=True 커널을 여러 스레드에서 동시에 부르면 스레딩 계층에 따라 중단/종료 지연 발생)
+    @numba.njit(nogil=True)
+    def _nb_count_out_of_range(a, lo, hi):
+        count = 0
+        for i in range(a.size):
+            if a[i] < lo or a[i] > hi:
+                count += 1
+        return count
+
+    @numba.njit(nogil=True)
+    def _nb_count_nans(a):
+        count = 0
+        for i in range(a.size):
+            if a[i] != a[i]:
+                count += 1
+        return count
+
+def count_out_of_range(a, lo, hi):
+    if numba is not None and a.size >= NUMBA_MIN_SIZE:
+        return int(_nb_count_out_of_range(a, float(lo), float(hi)))
+    if numexpr is not None and a.size >= NUMEXPR_MIN_SIZE:
+        # 두 비교와 OR을 한 번의 블록 단위 순회로 융합 (임시 배열은 결과 하나뿐)
+        return np.count_nonzero(numexpr.evaluate("(a < lo) | (a > hi)", local_dict={"a": a, "lo": float(lo), "hi": float(hi)}))
+    return np.count_nonzero((a < lo) | (a > hi))
+
+def count_nans(a):
+    # check_value_completeness(개별 API)의 전체 float 프레임 경로에서 사용
+    if numba is not None and a.size >= NUMBA_MIN_SIZE:
+        return int(_nb_count_nans(a))
+    return np.count_nonzero(np.isnan(a))
+
+# 고유값 비율이 이 값 이하인 문자열 컬럼만 category로 변환
+CATEGORY_SAMPLE_ROWS = 10_000
+CATEGORY_MAX_RATIO = 0.5
+
 class DQChecker:
     def __init__(self, df, rules):
-        self.df = df
+        # df가 None이면 청크 스트리밍 전용 (run_chunks)
         self.rules = rules.get("evaluation_rules", {})
+        syntax_rules = self.rules.get("3_syntax_validity", {}).get("columns", {})
+        self._syntax_re, self._syntax_plan, self._syntax_python = self._compile_syntax(tuple(syntax_rules.items()))
+        semantic_rules = self.rules.get("4_semantic_validity", {}).get("columns", {})
+        self._semantic_rules = {col: frozenset(valid_list) for col, valid_list in semantic_rules.items()}
+        self._semantic_null_values = {col: [v for v in valid_set if pd.isna(v)] for col, valid_set in self._semantic_rules.items()}
+        self._semantic_domains = {col: self._numeric_domain(valid_set) for col, valid_set in self._semantic_rules.items()}
+        self._range_rules = self.rules.get("5_range_validity", {}).get("columns", {})
+        self._numeric_cache = {}
+        self._ref_parent_cache = {}
+        self._ref_lock = threading.Lock()
+        self._ref_key_locks = {}
+        self._chunk_totals = {}
+        self._null_mask = None
+        self._rel_engines = {}
+        self.df = df
+        self._prepared_columns = {}
+        self.rule_errors = []
+        # 스트리밍 모드는 컬럼 dtype을 모르므로 첫 청크에서 식을 마저 검증
+        self._rel_rules = self._validate_relationship_rules(self.rules.get("6_relationship_validity", {}).get("rules", []),
+                                                            self.df.iloc[:0] if df is not None else None)
+        self._rel_checked = df is not None
+        self._ref_rules = self._validate_referential_rules()
+
+    def _prepare(self, col, series, cache=None):
+        # dtype 변환은 구문/의미 검사가 실제로 그 컬럼을 볼 때만 하고, cache가 있으면 재실행 시 재사용
+        if col not in self._syntax_re and col not in self._semantic_rules: return series
+        if cache is not None and col in cache: return cache[col]
+        # 결측치 때문에 float로 읽힌 정수 컬럼은 Int64로 한 번만 변환 ("1.0" -> "1")
+        # int64 범위를 넘는 값(1e20 등)은 변환할 수 없으므로 float로 두고 구문 검사에서 ".0"만 제거
+        if col in self._syntax_re and pd.api.types.is_float_dtype(series):
+            values = series.dropna()
+            if (values % 1 == 0).all() and (values.abs() < 2 ** 63).all():
+                series = series.astype("Int64")
+        # 저카디널리티 문자열 컬럼은 category로 바꿔, 정규식/집합 검사는 고유값에만 하고 행은 정수 코드로 판정
+        # (ID처럼 거의 모두 고유한 컬럼은 변환 비용만 들고 이득이 없으므로 그대로 두고 행 전체를 str.match로 판정)
+        if (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)) and self._is_low_cardinality(series):
+            series = series.astype("category")
+        if cache is not None: cache[col] = series
+        return series
+
+    @staticmethod
+    def _is_low_cardinality(series, sample_rows=CATEGORY_SAMPLE_ROWS, max_ratio=CATEGORY_MAX_RATIO):
+        # 앞부분 표본의 고유값 비율로 추정 (전체 nunique는 변환만큼 비싸므로)
+        sample = series.iloc[:sample_rows]
+        return sample.nunique(dropna=True) <= max_ratio * max(len(sample), 1)
+
+    @staticmethod
+    def _score(invalid_count, total_checks):
+        return (1 - (invalid_count / total_checks)) * 100 if total_checks > 0 else 100
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _compile_syntax(syntax_items):
+        # 같은 규칙으로 데이터 파일만 바꿔 다시 만들 때는 컴파일 결과(정규식/단순 패턴 계획)를 재사용
+        syntax_rules = dict(syntax_items)
+        syntax_re = {col: re.compile(pattern) for col, pattern in syntax_rules.items()}
+        # \d, \w, \s, \b는 RE2(ASCII)와 re(유니코드)의 의미가 달라 Arrow 문자열에서도 re로 판정
+        python_only = {col for col, regex in syntax_re.items() if re.search(r"\\[dDwWsSbB]", regex.pattern)}
+        return syntax_re, DQChecker._compile_syntax_plan(syntax_rules), python_only
+
+    @staticmethod
+    def _compile_syntax_plan(syntax_rules):
+        # 정규식 엔진이 필요 없는 단순 패턴은 벡터화된 문자열 연산으로 대체
+        # (re.match 의미 유지: '.'은 개행 제외, '$'는 끝의 개행 하나 앞에서도 일치)
+        plan = {}
+        for col, pattern in syntax_rules.items():
+            if pattern in (".*", "^.*"):
+                plan[col] = lambda values: values.notna().to_numpy()
+            elif pattern in (".+", "^.+"):
+                plan[col] = lambda values: ((values.str.len() > 0) & ~values.str.startswith("\n")).to_numpy(dtype=bool, na_value=False)
+            elif m := re.fullmatch(r"\^?(\w+)", pattern, re.ASCII):
+                plan[col] = partial(DQChecker._starts_with, prefix=m.group(1))
+            elif m := re.fullmatch(r"\^\.\{(\d+)(?:(,)(\d*))?\}\$", pattern):
+                lo = int(m.group(1))
+                hi = lo if m.group(2) is None else int(m.group(3)) if m.group(3) else None
+                if hi is None or lo <= hi:
+                    plan[col] = partial(DQChecker._length_between, lo=lo, hi=hi)
+        return plan
+
+    @staticmethod
+    def _starts_with(values, prefix):
+        return values.str.startswith(prefix).to_numpy(dtype=bool, na_value=False)
+
+    @staticmethod
+    def _length_between(values, lo, hi):
+        body = values.str.removesuffix("\n")
+        lengths = body.str.len()
+        valid = ~body.str.contains("\n", regex=False) & (lengths >= lo)
+        if hi is not None:
+            valid &= lengths <= hi
+        return valid.to_numpy(dtype=bool, na_value=False)
+
+    def _match_syntax(self, col, values):
+        if col in self._syntax_plan:
+            return self._syntax_plan[col](values)
+        regex = self._syntax_re[col]
+        # Arrow 문자열의 str.match는 RE2로 실행되므로 re와 결과가 다를 수 있는 경우만 python 저장소로 판정
+        if getattr(values.dtype, "storage", None) == "pyarrow":
+            if col in self._syntax_python:
+                values = values.astype(pd.StringDtype("python"))
+            else:
+                matches = values.str.match(regex, na=False).to_numpy(dtype=bool)
+                # RE2의 '$'는 끝의 개행 앞에서 일치하지 않으므로 개행이 있는 값만 re로 다시 판정
+                multiline = values.str.contains("\n", regex=False).to_numpy(dtype=bool, na_value=False)
+                if multiline.any():
+                    matches = matches.copy()
+                    matches[multiline] = values[multiline].astype(pd.StringDtype("python")).str.match(regex, na=False).to_numpy(dtype=bool)
+                return matches
+        return values.str.match(regex, na=False).to_numpy(dtype=bool)
+
+    @staticmethod
+    def _as_string(series):
+        # 이미 문자열 dtype이면 변환(복사) 없이 그대로 사용
+        return series if isinstance(series.dtype, pd.StringDtype) else series.astype("string")
+
+    def _syntax_counts(self, col, series, nulls=None):
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            categories = self._as_string(pd.Series(series.cat.categories))
+            valid = self._match_syntax(col, categories)
+            codes = series.cat.codes.to_numpy()
+            present = codes >= 0
+            return np.count_nonzero(present & ~valid[codes]), np.count_nonzero(present)
+        is_float = pd.api.types.is_float_dtype(series)
+        series = self._as_string(series)
+        if is_float:
+            # Int64로 바꾸지 못한 float 컬럼은 값마다 끝의 ".0"을 제거 (2.0 -> "2", 2.5는 그대로)
+            series = series.str.replace(r"\.0$", "", regex=True)
+        present = ~nulls if nulls is not None else series.notna().to_numpy()
+        matches = self._match_syntax(col, series)
+        return np.count_nonzero(present & ~matches), np.count_nonzero(present)
+
+    @staticmethod
+    def _membership(series, value_set, allow_null=False, nulls=None):
+        # 미리 만든 값 집합(frozenset)에 대한 소속 여부를 bool 배열로 반환
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            categories = series.cat.categories
+            valid = np.fromiter((c in value_set for c in categories), dtype=bool, count=len(categories))
+            codes = series.cat.codes.to_numpy()
+            matches = (codes >= 0) & valid[codes]
+        elif series.dtype == object:
+            contains = np.frompyfunc(value_set.__contains__, 1, 1)
+            matches = contains(series.to_numpy()).astype(bool)
+        else:
+            # 숫자/Arrow 컬럼은 pandas isin이 C 해시 테이블이나 pyarrow.compute.is_in으로 처리
+            matches = series.isin(value_set).to_numpy(dtype=bool, na_value=False)
+        if allow_null:
+            matches = matches | (nulls if nulls is not None else series.isna().to_numpy())
+        return matches
+
+    @staticmethod
+    def _numeric_domain(value_set):
+        # 숫자 컬럼용 허용값: float 정렬 배열, 정수 컬럼용 int64 정렬 배열(2**53 초과 값도 정확히 비교), 작은 음이 아닌 정수 집합이면 bool LUT
+        numbers = [v for v in value_set if isinstance(v, (int, float, np.number)) and not pd.isna(v)]
+        domain = np.unique(np.asarray(numbers, dtype="float64"))
+        integers = []
+        for v in numbers:
+            try:
+                i = int(v)
+            except (OverflowError, ValueError):
+                continue
+            if i == v and -(1 << 63) <= i < 1 << 63: integers.append(i)
+        int_domain = np.unique(np.asarray(integers, dtype=np.int64))
+        lut = None
+        if int_domain.size and int_domain[0] >= 0 and int_domain[-1] < 1 << 16:
+            lut = np.zeros(int(int_domain[-1]) + 1, dtype=bool)
+            lut[int_domain] = True
+        return domain, int_domain, lut
+
+    @staticmethod
+    def _in_sorted(domain, values):
+        if not domain.size: return np.zeros(values.size, dtype=bool)
+        idx = np.minimum(np.searchsorted(domain, values), domain.size - 1)
+        return domain[idx] == values
+
+    @staticmethod
+    def _numeric_membership(series, domain, int_domain, lut):
+        kind = series.dtype.kind
+        if kind == "i" or (kind == "u" and series.dtype.itemsize < 8):
+            # 정수 컬럼은 float64로 바꾸지 않고 int64 그대로 비교 (결측은 0으로 채운 뒤 마스킹)
+            values = series.to_numpy(dtype="int64", na_value=0)
+            if lut is not None:
+                inside = (values >= 0) & (values < lut.size)
+                matches = inside & lut[np.where(inside, values, 0)]
+            else:
+                matches = DQChecker._in_sorted(int_domain, values)
+        elif kind == "u":
+            values = series.to_numpy(dtype="uint64", na_value=0)
+            matches = DQChecker._in_sorted(int_domain[int_domain >= 0].astype(np.uint64), values)
+        else:
+            return DQChecker._in_sorted(domain, series.to_numpy(dtype="float64", na_value=np.nan))
+        if series.hasnans: matches &= series.notna().to_numpy()
+        return matches
+
+    def _semantic_counts(self, col, series, nulls=None):
+        # 결측 판정은 기존 isin과 같게: 숫자 컬럼은 isin이 일치시키는 결측 표현(float NaN 등)만 허용하고,
+        # 문자열/객체 컬럼은 집합 조회 자체가 None 등을 판정. category만 허용값에 결측이 있으면 결측을 허용
+        null_values = self._semantic_null_values[col]
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            matches = self._numeric_membership(series, *self._semantic_domains[col])
+            if null_values:
+                matches = matches | series.isin(null_values).to_numpy(dtype=bool, na_value=False)
+        else:
+            allow_null = bool(null_values) and isinstance(series.dtype, pd.CategoricalDtype)
+            matches = self._membership(series, self._semantic_rules[col], allow_null, nulls)
+        return np.count_nonzero(~matches), len(series)
+
+    def _range_counts(self, col, series, nulls=None, numeric_cache=None):
+        # NaN은 범위 비교에서 위반으로 세지 않으므로 결측 마스크(nulls)는 필요 없음
+        limits = self._range_rules[col]
+        temp = numeric_cache.get(col) if numeric_cache is not None else None
+        if temp is None:
+            if pd.api.types.is_numeric_dtype(series):
+                temp = series.to_numpy(dtype="float64", na_value=np.nan)
+            else:
+                temp = pd.to_numeric(series, errors='coerce').to_numpy(dtype="float64", na_value=np.nan)
+            if numeric_cache is not None: numeric_cache[col] = temp
+        return count_out_of_range(temp, limits['min'], limits['max']), len(series)
+
+    def _column_checks(self, counts_fn, rules):
+        if not rules: return 100.0
+        invalid_count, total_checks = 0, 0
+        for col in rules:
+            if col in self.df.columns:
+                invalid, total = counts_fn(col, self._prepare(col, self.df[col], self._prepared_columns))
+                invalid_count += invalid
+                total_checks += total
+        return self._score(invalid_count, total_checks)
+
+    def _get_null_mask(self):
+        # 값/레코드 완전성이 같은 결측 마스크 하나를 공유
+        if self._null_mask is None:
+            self._null_mask = self.df.isna().to_numpy()
+        return self._null_mask
 
     def check_value_completeness(self):
         total_cells = self.df.size
-        null_count = self.df.isnull().sum().sum()
+        if self._null_mask is None and total_cells and all(pd.api.types.is_float_dtype(dtype) for dtype in self.df.dtypes):
+            null_count = count_nans(self.df.to_numpy(dtype="float64", na_value=np.nan).ravel())
+        else:
+            null_count = np.count_nonzero(self._get_null_mask())
         return (1 - (null_count / total_cells)) * 100 if total_cells > 0 else 100
 
     def check_record_completeness(self):
-        empty_rows = self.df.isnull().all(axis=1).sum()
+        empty_rows = np.count_nonzero(self._get_null_mask().all(axis=1))
         return (1 - (empty_rows / len(self.df))) * 100 if len(self.df) > 0 else 100
 
     def check_syntax_validity(self):
-        syntax_rules = self.rules.get("3_syntax_validity", {}).get("columns", {})
-        if not syntax_rules: return 100.0
-        invalid_count, total_checks = 0, 0
-        for col, pattern in syntax_rules.items():
-            if col in self.df.columns:
-                series = self.df[col].dropna()
-                if not series.empty:
-                    def clean_str(x):
-                        s = str(x)
-                        return s[:-2] if s.endswith('.0') else s
-                    matches = series.apply(clean_str).apply(lambda x: re.match(pattern, x) is not None)
-                    invalid_count += (~matches).sum()
-                    total_checks += len(series)
-        return (1 - (invalid_count / total_checks)) * 100 if total_checks > 0 else 100
+        return self._column_checks(self._syntax_counts, self._syntax_re)
 
     def check_semantic_validity(self):
-        semantic_rules = self.rules.get("4_semantic_validity", {}).get("columns", {})
-        if not semantic_rules: return 100.0
-        invalid_count, total_checks = 0, 0
-        for col, valid_list in semantic_rules.items():
-            if col in self.df.columns:
-                invalid_count += (~self.df[col].isin(valid_list)).sum()
-                total_checks += len(self.df)
-        return (1 - (invalid_count / total_checks)) * 100 if total_checks > 0 else 100
+        return self._column_checks(self._semantic_counts, self._semantic_rules)
 
     def check_range_validity(self):
-        range_rules = self.rules.get("5_range_validity", {}).get("columns", {})
-        if not range_rules: return 100.0
-        invalid_count, total_checks = 0, 0
-        for col, limits in range_rules.items():
-            if col in self.df.columns:
-                temp_series = pd.to_numeric(self.df[col], errors='coerce')
-                invalid_count += ((temp_series < limits['min']) | (temp_series > limits['max'])).sum()
-                total_checks += len(self.df)
-        return (1 - (invalid_count / total_checks)) * 100 if total_checks > 0 else 100
+        return self._column_checks(partial(self._range_counts, numeric_cache=self._numeric_cache), self._range_rules)
+
+    def _eval_formula(self, df, formula):
+        # numexpr가 지원하지 않는 식(문자열 연산 등)만 python 엔진으로 재평가하고,
+        # 식별로 성공한 엔진을 기억해 다음 청크부터는 실패할 시도를 반복하지 않음
+        engine = self._rel_engines.get(formula, 'numexpr' if numexpr else 'python')
+        try:
+            result = df.eval(formula, engine=engine)
+        except Exception:
+            if engine == 'python': raise
+            engine = 'python'
+            result = df.eval(formula, engine=engine)
+        self._rel_engines[formula] = engine
+        return result
+
+    def _validate_relationship_rules(self, rules, sample=None):
+        # 잘못된 식은 초기화 시 한 번만 걸러내고 rule_errors에 기록 -> 평가 루프에는 예외 처리가 없음
+        # sample(빈 프레임)이 있으면 실제로 평가해 없는 컬럼, 참/거짓이 아닌 결과도 걸러냄
+        valid_rules = []
+        for rule in rules:
+            try:
+                # 백틱으로 감싼 컬럼명은 파이썬 식별자가 아니므로 문법 검사 전에 치환
+                compile(re.sub(r"`[^`]*`", "_", rule["formula"]), "<rel>", "eval")
+                if sample is not None and not pd.api.types.is_bool_dtype(self._eval_formula(sample, rule["formula"])):
+                    raise TypeError("식의 결과가 참/거짓이 아닙니다")
+            except Exception as e:  # 사용자가 작성한 식이므로 평가 오류는 모두 규칙 오류로 기록
+                self.rule_errors.append(f"관계유효성 규칙 '{rule.get('name', '?')}': {e}")
+                continue
+            valid_rules.append(rule)
+        return valid_rules
+
+    def _relationship_counts(self, df):
+        n_rows = len(df)
+        total_violations, evaluated = 0, 0
+        for rule in self._rel_rules:
+            # 빈 프레임 검증으로는 값에 따라 달라지는 오류(문자열과 숫자 비교 등)를 알 수 없으므로
+            # 이 데이터(청크)에서만 해당 규칙을 제외하고 rule_errors에 한 번 기록
+            try:
+                mask = self._eval_formula(df, rule["formula"])
+            except (TypeError, ValueError, AttributeError) as e:
+                message = f"관계유효성 규칙 '{rule.get('name', '?')}': {e}"
+                if message not in self.rule_errors: self.rule_errors.append(message)
+                continue
+            # 청크마다 dtype 추론이 달라 참/거짓이 아닌 결과가 나오면 그 청크만 제외
+            if not pd.api.types.is_bool_dtype(mask): continue
+            total_violations += n_rows - np.count_nonzero(mask.fillna(False).to_numpy(dtype=bool))
+            evaluated += 1
+        return total_violations, n_rows * evaluated
 
     def check_relationship_validity(self):
-        rel_rules = self.rules.get("6_relationship_validity", {}).get("rules", [])
-        if not rel_rules: return 100.0
-        total_violations = 0
-        for rule in rel_rules:
+        return self._score(*self._relationship_counts(self.df))
+
+    def _parent_values(self, p_path, p_col):
+        # (파일, 컬럼)별 값 집합을 캐시하고 수정 시각이 바뀔 때만 다시 읽음
+        # 잠금은 (파일, 컬럼)마다 따로 두어 서로 다른 부모 파일은 동시에 읽을 수 있게 함
+        with self._ref_lock:
+            key_lock = self._ref_key_locks.setdefault((p_path, p_col), threading.Lock())
+        with key_lock:
+            return self._load_parent_values(p_path, p_col)
+
+    def _load_parent_values(self, p_path, p_col):
+        mtime = os.path.getmtime(p_path)
+        entry = self._ref_parent_cache.get((p_path, p_col))
+        if entry is None or entry[0] != mtime:
+            # 부모 파일 전체가 아니라 참조 컬럼만 읽음
+            values = read_table(p_path, usecols=[p_col])[p_col]
+            entry = (mtime, frozenset(values.dropna()), values.hasnans)
+            self._ref_parent_cache[(p_path, p_col)] = entry
+        return entry[1:]
+
+    def _validate_referential_rules(self):
+        # 부모 파일은 초기화 시 스레드 풀에서 동시에 읽어 캐시에 올리고, 열 수 없는 규칙은 제외
+        valid_rules = []
+        checks = self.rules.get("7_referential_integrity", {}).get("checks", [])
+        if not checks: return valid_rules
+        with ThreadPoolExecutor(max_workers=min(len(checks), os.cpu_count() or 4)) as executor:
+            loads = [executor.submit(lambda rule=rule: self._parent_values(rule["parent_file"], rule["parent_column"]))
+                     for rule in checks]
+        for rule, load in zip(checks, loads):
             try:
-                valid_count = len(self.df.query(rule["formula"], engine='python'))
-                total_violations += (len(self.df) - valid_count)
-            except: continue
-        total_checks = len(self.df) * len(rel_rules)
-        return (1 - (total_violations / total_checks)) * 100 if total_checks > 0 else 100
+                load.result()
+                if self.df is not None and rule["child_column"] not in self.df.columns:
+                    raise KeyError(rule["child_column"])
+            except Exception as e:  # 사용자가 지정한 파일이므로 읽기 오류는 모두 규칙 오류로 기록
+                self.rule_errors.append(f"참조무결성 규칙 '{rule.get('parent_file', '?')}': {e!r}")
+                continue
+            valid_rules.append(rule)
+        return valid_rules
+
+    def _referential_counts(self, df):
+        total_violations, evaluated = 0, 0
+        for rule in self._ref_rules:
+            if rule["child_column"] not in df.columns: continue
+            parent_set, parent_has_null = self._parent_values(rule["parent_file"], rule["parent_column"])
+            matches = self._membership(df[rule["child_column"]], parent_set, parent_has_null)
+            total_violations += np.count_nonzero(~matches)
+            evaluated += 1
+        return total_violations, len(df) * evaluated
 
     def check_referential_integrity(self):
-        ref_rules = self.rules.get("7_referential_integrity", {}).get("checks", [])
-        if not ref_rules: return 100.0
-        total_violations = 0
-        for rule in ref_rules:
-            try:
-                p_path = rule["parent_file"]
-                p_df = pd.read_csv(p_path) if p_path.endswith('.csv') else pd.read_excel(p_path)
-                total_violations += (~self.df[rule["child_column"]].isin(p_df[rule["parent_column"]])).sum()
-            except: continue
-        total_checks = len(self.df) * len(ref_rules)
-        return (1 - (total_violations / total_checks)) * 100 if total_checks > 0 else 100
+        return self._score(*self._referential_counts(self.df))
+
+    def _scan_columns(self, columns, n_rows, need_nulls, column_checks, column_cache=None):
+        counts = {key: [0, 0] for key in ("Value", "Syntax", "Semantic", "Range")}
+        row_nulls = np.zeros(n_rows, dtype=np.int64)
+        # 각 컬럼은 한 번 꺼내 결측 마스크를 만들고, 그 마스크를 모든 검사가 공유
+        for col, series in columns:
+            nulls = None
+            if need_nulls:
+                nulls = series.isna().to_numpy()
+                counts["Value"][0] += np.count_nonzero(nulls)
+                counts["Value"][1] += nulls.size
+                row_nulls += nulls
+            checks = [(key, counts_fn) for key, counts_fn, rules in column_checks if col in rules]
+            if not checks: continue
+            series = self._prepare(col, series, column_cache)
+            for key, counts_fn in checks:
+                invalid, total = counts_fn(col, series, nulls)
+                counts[key][0] += invalid
+                counts[key][1] += total
+        return counts, row_nulls
+
+    def _counts(self, df, selected, numeric_cache=None, column_cache=None, max_workers=None, on_done=None):
+        # 결측/구문/의미/범위 지표는 컬럼당 한 번의 순회로 함께 집계
+        # 컬럼 묶음과 관계/참조 검사는 스레드 풀에서 동시에 실행 (pandas/NumPy 연산은 GIL을 해제)
+        # on_done(key, (위반 수, 검사 수))은 지표가 확정되는 즉시 호출
+        range_rules, polars_range = self._range_rules, []
+        if pl is not None and "Range" in selected:
+            # 숫자 컬럼의 범위 검사는 Polars 식 하나로 묶어 Rust 스레드에서 한 번에 실행
+            polars_range = [col for col in range_rules if col in df.columns
+                            and pd.api.types.is_numeric_dtype(df[col]) and not pd.api.types.is_bool_dtype(df[col])]
+            range_rules = {col: limits for col, limits in range_rules.items() if col not in polars_range}
+        column_checks = [
+            (key, counts_fn, rules) for key, counts_fn, rules in (
+                ("Syntax", self._syntax_counts, self._syntax_re),
+                ("Semantic", self._semantic_counts, self._semantic_rules),
+                ("Range", partial(self._range_counts, numeric_cache=numeric_cache), range_rules),
+            ) if key in selected and rules
+        ]
+        need_nulls = "Value" in selected or "Record" in selected
+        if need_nulls:
+            columns = list(df.items())
+        else:
+            columns = [(col, series) for col, series in df.items()
+                       if any(col in rules for _, _, rules in column_checks)]
+        max_workers = max_workers or min(7, os.cpu_count() or 4)
+        groups = [columns[i::max_workers] for i in range(max_workers) if columns[i::max_workers]]
+
+        counts = {key: [0, 0] for key in ("Value", "Syntax", "Semantic", "Range")}
+        row_nulls = np.zeros(len(df), dtype=np.int64)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            rule_futures = {}
+            if "Rel" in selected: rule_futures["Rel"] = executor.submit(self._relationship_counts, df)
+            if "Ref" in selected: rule_futures["Ref"] = executor.submit(self._referential_counts, df)
+            scans = {executor.submit(self._scan_columns, group, len(df), need_nulls, column_checks, column_cache) for group in groups}
+            if polars_range: scans.add(executor.submit(self._polars_range_counts, df, polars_range))
+            rule_keys = {future: key for key, future in rule_futures.items()}
+            pending_scans = len(scans)
+            if not scans:
+                self._finish_column_counts(df, selected, counts, row_nulls, on_done)
+            for future in as_completed(scans | set(rule_keys)):
+                if future in rule_keys:
+                    key = rule_keys[future]
+                    counts[key] = future.result()
+                    if on_done: on_done(key, counts[key])
+                    continue
+                group_counts, group_row_nulls = future.result()
+                for key, (invalid, total) in group_counts.items():
+                    counts[key][0] += invalid
+                    counts[key][1] += total
+                if group_row_nulls is not None: row_nulls += group_row_nulls
+                pending_scans -= 1
+                if not pending_scans:
+                    self._finish_column_counts(df, selected, counts, row_nulls, on_done)
+        return {key: tuple(counts[key]) for key in selected if key in counts}
+
+    def _polars_range_counts(self, df, columns):
+        # NaN은 null로 바꿔 비교에서 제외 (pandas 경로의 NaN 비위반 규칙과 동일)
+        frame = pl.from_pandas(df[columns], nan_to_null=True)
+        exprs = []
+        for col in columns:
+            limits = self._range_rules[col]
+            exprs.append(((pl.col(col) < limits['min']) | (pl.col(col) > limits['max'])).sum())
+        invalid = sum(frame.select(exprs).row(0))
+        return {"Range": (invalid, len(df) * len(columns))}, None
+
+    @staticmethod
+    def _finish_column_counts(df, selected, counts, row_nulls, on_done):
+        counts["Record"] = (np.count_nonzero(row_nulls == df.shape[1]), len(df))
+        if on_done:
+            for key in ("Value", "Record", "Syntax", "Semantic", "Range"):
+                if key in selected: on_done(key, tuple(counts[key]))
+
+    def required_columns(self, columns, selected):
+        # 선택한 검사에 필요한 컬럼만 반환 (값/레코드 완전성은 모든 컬럼 필요)
+        columns = list(columns)
+        if "Value" in selected or "Record" in selected: return columns
+        needed = set()
+        if "Syntax" in selected: needed |= set(self._syntax_re)
+        if "Semantic" in selected: needed |= set(self._semantic_rules)
+        if "Range" in selected: needed |= set(self._range_rules)
+        if "Rel" in selected:
+            # 식에 이름이 등장하는 컬럼을 모두 포함 (식 파싱 없이 넉넉하게)
+            needed |= {col for col in columns if any(col in rule["formula"] for rule in self._rel_rules)}
+        if "Ref" in selected: needed |= {rule["child_column"] for rule in self._ref_rules}
+        # 행 수가 총 검사 수에 쓰이므로 최소 한 컬럼은 읽음
+        return [col for col in columns if col in needed] or columns[:1]
+
+    def run_all(self, selected, max_workers=None, on_result=None):
+        selected = list(selected)
+        on_done = (lambda key, count: on_result(key, self._score(*count))) if on_result else None
+        counts = self._counts(self.df, selected, self._numeric_cache, self._prepared_columns, max_workers, on_done)
+        return {key: self._score(*counts[key]) for key in selected if key in counts}
+
+    def update_from_chunk(self, chunk, selected, max_workers=None):
+        # 청크별 (위반 수, 검사 수)를 누적 -> 전체 파일을 메모리에 올리지 않고 점수 계산
+        for key, (invalid, total) in self._counts(chunk, selected, max_workers=max_workers).items():
+            totals = self._chunk_totals.setdefault(key, [0, 0])
+            totals[0] += invalid
+            totals[1] += total
+
+    def run_chunks(self, chunks, selected, max_workers=None):
+        selected = list(selected)
+        self._chunk_totals = {}
+        # 현재 청크를 검사하는 동안 다음 청크를 백그라운드에서 미리 읽어 I/O와 계산을 겹침
+        chunks = iter(chunks)
+        with ThreadPoolExecutor(max_workers=1) as reader:
+            pending = reader.submit(next, chunks, None)
+            while (chunk := pending.result()) is not None:
+                pending = reader.submit(next, chunks, None)
+                if "Rel" in selected and not self._rel_checked:
+                    self._rel_rules = self._validate_relationship_rules(self._rel_rules, chunk.iloc[:0])
+                    self._rel_checked = True
+                self.update_from_chunk(chunk, selected, max_workers)
+        return {key: self._score(*self._chunk_totals.get(key, (0, 0))) for key in selected}
+
+METRIC_NAMES = {
+    "Value": "데이터값완전성", "Record": "데이터레코드완전성",
+    "Syntax": "구문유효성", "Semantic": "의미유효성",
+    "Range": "범위유효성", "Rel": "관계유효성", "Ref": "참조무결일관성"
+}
+
+class WorkerSignals(QObject):
+    result = pyqtSignal(str, float)
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+    rule_errors = pyqtSignal(object)
+
+class LoadWorker(QRunnable):
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            self.signals.finished.emit((self.path, read_table(self.path)))
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+class CheckerWorker(QRunnable):
+    # 규칙 검증 중 부모 파일을 읽으므로 DQChecker 생성도 GUI 스레드 밖에서 수행
+    def __init__(self, df, rules):
+        super().__init__()
+        self.df = df
+        self.rules = rules
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            self.signals.finished.emit(DQChecker(self.df, self.rules))
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+class EvalWorker(QRunnable):
+    def __init__(self, checker, selected, stream_path=None):
+        super().__init__()
+        self.checker = checker
+        self.selected = selected
+        self.stream_path = stream_path
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            # 스트리밍 첫 청크 검증이나 평가 중에 새로 발견된 규칙 오류만 따로 알림
+            known_errors = len(self.checker.rule_errors)
+            if self.stream_path:
+                # 청크 스트리밍은 마지막 청크까지 누적해야 점수가 확정됨
+                columns = pd.read_csv(self.stream_path, nrows=0).columns
+                usecols = self.checker.required_columns(columns, self.selected)
+                results = self.checker.run_chunks(read_csv_chunks(self.stream_path, usecols=usecols), self.selected)
+                for key in self.selected:
+                    self.signals.result.emit(key, float(results[key]))
+            else:
+                # 검사가 끝나는 대로 해당 지표 결과를 GUI 스레드로 전달
+                results = self.checker.run_all(self.selected, on_result=lambda key, score: self.signals.result.emit(key, float(score)))
+            if len(self.checker.rule_errors) > known_errors:
+                self.signals.rule_errors.emit(self.checker.rule_errors[known_errors:])
+            self.signals.finished.emit(results)
+        except Exception as e:
+            self.signals.error.emit(str(e))
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -91,7 +656,14 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Data Quality Pro - Studio")
         self.setMinimumSize(1100, 800)
         self.data_df = None
+        self.data_path = None
         self.rules = None
+        self.checker = None
+        self._score_items = {}
+        self._checker_token = 0
+        # 분석 실행마다 토큰을 부여해, 데이터/규칙 변경으로 대체된 분석의 신호는 무시
+        self._eval_token = 0
+        self._running_eval = None
         self.init_ui()
         self.apply_style()
 
@@ -229,11 +801,7 @@ class MainWindow(QMainWindow):
 
         sidebar.addSpacing(35)
         sidebar.addWidget(QLabel("ANALYSIS METRICS"))
-        self.checks = {
-            "Value": QCheckBox("데이터값완전성"), "Record": QCheckBox("데이터레코드완전성"),
-            "Syntax": QCheckBox("구문유효성"), "Semantic": QCheckBox("의미유효성"),
-            "Range": QCheckBox("범위유효성"), "Rel": QCheckBox("관계유효성"), "Ref": QCheckBox("참조무결일관성")
-        }
+        self.checks = {key: QCheckBox(name) for key, name in METRIC_NAMES.items()}
         for cb in self.checks.values():
             cb.setChecked(True)
             sidebar.addWidget(cb)
@@ -288,41 +856,139 @@ class MainWindow(QMainWindow):
     def load_file(self):
         path, _ = QFileDialog.getOpenFileName(self, "Open Data", "", "Data (*.csv *.xlsx)")
         if path:
-            self.data_df = pd.read_csv(path) if path.endswith('.csv') else pd.read_excel(path)
-            self.status_bar.setText(f"File: {os.path.basename(path)}")
+            if path.endswith('.csv') and os.path.getsize(path) >= STREAM_MIN_BYTES:
+                self.on_file_loaded((path, None))
+                return
+            self.btn_data.setEnabled(False)
+            self.status_bar.setText(f"Loading: {os.path.basename(path)}")
+            worker = LoadWorker(path)
+            worker.signals.finished.connect(self.on_file_loaded)
+            worker.signals.error.connect(self.on_worker_error)
+            self._load_worker = worker
+            QThreadPool.globalInstance().start(worker)
+
+    def on_file_loaded(self, loaded):
+        self.data_path, self.data_df = loaded
+        self.btn_data.setEnabled(True)
+        self.refresh_checker()
+        mode = " (streaming)" if self.data_df is None else ""
+        self.status_bar.setText(f"File: {os.path.basename(self.data_path)}{mode}")
 
     def load_json(self):
         path, _ = QFileDialog.getOpenFileName(self, "Open Rules", "", "JSON (*.json)")
         if path:
             with open(path, 'r', encoding='utf-8') as f:
                 self.rules = json.load(f)
+            self.refresh_checker()
             self.status_bar.setText(f"Rules: {os.path.basename(path)}")
 
+    def refresh_checker(self):
+        # 데이터/규칙이 바뀔 때만 새로 만들어, 실행 간 캐시(정규식, 수치 변환, 부모 파일)를 유지
+        if self.data_path is not None and self.rules is not None:
+            # 먼저 시작한 생성 작업이 늦게 끝나도 최신 데이터/규칙의 검사기만 사용하도록 토큰으로 구분
+            self._checker_token += 1
+            self.checker = None
+            self.btn_run.setEnabled(False)
+            if self._running_eval == self._eval_token:
+                # 진행 중인 분석은 이전 검사기 기준이므로 결과를 버리고 빈 칸을 정리
+                self._eval_token += 1
+                for item in self._score_items.values():
+                    if item.text() == "...": item.setText("-")
+            worker = CheckerWorker(self.data_df, self.rules)
+            worker.signals.finished.connect(partial(self.on_checker_ready, self._checker_token))
+            worker.signals.error.connect(self.on_worker_error)
+            self._checker_worker = worker
+            QThreadPool.globalInstance().start(worker)
+
+    def on_checker_ready(self, token, checker):
+        if token != self._checker_token: return
+        self.checker = checker
+        self.update_run_button()
+        self.show_rule_errors(checker.rule_errors)
+
+    def update_run_button(self):
+        # 검사기가 준비되어 있고 진행 중인 분석이 없을 때만 실행 가능
+        self.btn_run.setEnabled(self.checker is not None and self._running_eval is None)
+
+    def show_rule_errors(self, errors):
+        if errors:
+            QMessageBox.warning(self, "Rules", "\n".join(errors))
+
+    def on_eval_rule_errors(self, token, errors):
+        if token == self._eval_token: self.show_rule_errors(errors)
+
     def run_eval(self):
-        if self.data_df is None or self.rules is None: return
-        
-        checker = DQChecker(self.data_df, self.rules)
-        mapping = {
-            "Value": ("데이터값완전성", checker.check_value_completeness),
-            "Record": ("데이터레코드완전성", checker.check_record_completeness),
-            "Syntax": ("구문유효성", checker.check_syntax_validity),
-            "Semantic": ("의미유효성", checker.check_semantic_validity),
-            "Range": ("범위유효성", checker.check_range_validity),
-            "Rel": ("관계유효성", checker.check_relationship_validity),
-            "Ref": ("참조무결일관성", checker.check_referential_integrity)
-        }
-
-        self.result_table.setRowCount(0)
-        scores = []
-        for key, (name, func) in mapping.items():
-            if self.checks[key].isChecked():
-                row = self.result_table.rowCount()
-                self.result_table.insertRow(row)
-                score = func()
-                scores.append(score)
-                self.result_table.setItem(row, 0, QTableWidgetItem(name))
-                self.result_table.setItem(row, 1, QTableWidgetItem(f"{score:.2f}%"))
+        if self.checker is None or self._running_eval is not None: return
+
+        selected = [key for key in METRIC_NAMES if self.checks[key].isChecked()]
+        # 행을 미리 한 번에 만들어 두고, 결과는 해당 행의 점수 칸만 채운다
+        table = self.result_table
+        sorting = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        table.blockSignals(True)
+        if list(self._score_items) == selected:
+            # 같은 지표 구성으로 다시 실행하면 기존 셀을 재사용하고 점수만 초기화
+            for item in self._score_items.values():
+                item.setText("...")
+        else:
+            table.setRowCount(len(selected))
+            self._score_items = {}
+            for row, key in enumerate(selected):
+                self._score_items[key] = QTableWidgetItem("...")
+                table.setItem(row, 0, QTableWidgetItem(METRIC_NAMES[key]))
+                table.setItem(row, 1, self._score_items[key])
+        table.blockSignals(False)
+        table.setSortingEnabled(sorting)
+        table.setUpdatesEnabled(True)
+        table.viewport().update()
+
+        self._eval_token += 1
+        self._running_eval = token = self._eval_token
+        self.update_run_button()
+        self.status_bar.setText("Analyzing...")
+        stream_path = self.data_path if self.data_df is None else None
+        worker = EvalWorker(self.checker, selected, stream_path)
+        worker.signals.result.connect(partial(self.add_result, token))
+        worker.signals.finished.connect(partial(self.show_grade, token))
+        worker.signals.error.connect(partial(self.on_eval_error, token))
+        worker.signals.rule_errors.connect(partial(self.on_eval_rule_errors, token))
+        self._eval_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def add_result(self, token, key, score):
+        if token != self._eval_token: return
+        self._score_items[key].setText(f"{score:.2f}%")
+
+    def finish_eval(self, token):
+        # 끝난 분석이 실행 중이던 것이면 실행 버튼을 다시 풀고, 대체된 분석이면 False를 돌려 결과를 버리게 함
+        if token == self._running_eval:
+            self._running_eval = None
+            self.update_run_button()
+        return token == self._eval_token
+
+    def on_worker_error(self, message):
+        self.btn_data.setEnabled(True)
+        self.update_run_button()
+        self.status_bar.setText("Error")
+        QMessageBox.warning(self, "Error", message)
+
+    def on_eval_error(self, token, message):
+        if not self.finish_eval(token): return
+        # 실패한 분석의 빈 칸과 이전 실행의 등급이 남아 결과처럼 보이지 않도록 초기화
+        for item in self._score_items.values():
+            if item.text() == "...": item.setText("-")
+        self.grade_badge.setText("-")
+        self.grade_badge.setStyleSheet("background-color: #232738; border-radius: 45px; color: #444; font-size: 45px; font-weight: bold; border: 2px solid #2D334A;")
+        self.avg_score_label.setText("Analysis failed")
+        self.grade_desc.setText("No grade: the analysis did not complete.")
+        self.grade_desc.setStyleSheet("color: #546E7A; font-size: 14px;")
+        self.on_worker_error(message)
 
+    def show_grade(self, token, results):
+        if not self.finish_eval(token): return
+        self.status_bar.setText("Analysis complete")
+        scores = list(results.values())
         if scores:
             avg = sum(scores) / len(scores)
             if avg >= 99: g, color, desc = "A", "#00E676", "Excellent: High quality data detected."
@@ -0,0 +1,30 @@
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from DQ import DQChecker, read_csv_chunks, read_table
+
+
+RULES = {
+    "evaluation_rules": {
+        "3_syntax_validity": {"columns": {"ts": r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$"}},
+        "4_semantic_validity": {"columns": {"hire": ["2020-01-01", "2020-05-01"]}},
+    }
+}
+
+
+def test_in_memory_and_streamed_scores_match_on_date_columns(tmp_path):
+    path = tmp_path / "dates.csv"
+    path.write_text(
+        "id,hire,ts\n"
+        "1,2020-01-01,2020-01-01 10:00:00\n"
+        "2,2020-05-01,2021-02-03T04:05:06\n"
+        "3,2021-01-01,\n"
+    )
+    selected = ["Syntax", "Semantic"]
+
+    in_memory = DQChecker(read_table(str(path)), RULES).run_all(selected)
+    streamed = DQChecker(None, RULES).run_chunks(read_csv_chunks(str(path), chunksize=2), selected)
+
+    assert in_memory == pytest.approx(streamed)
+    assert in_memory["Semantic"] == pytest.approx(200 / 3)